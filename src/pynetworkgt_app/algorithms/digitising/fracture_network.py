@@ -2,26 +2,35 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Optional, Sequence, Tuple
 
 import numpy as np
 
-try:  # pragma: no cover
-    import networkx as nx
-except ImportError as exc:  # pragma: no cover
-    raise RuntimeError('networkx is required for fracture digitising') from exc
-from shapely.geometry import LineString
+import shapely
 
 try:  # pragma: no cover - optional dependency for file IO
     import rasterio
 except ImportError:  # pragma: no cover
     rasterio = None
 
+try:  # pragma: no cover - optional acceleration
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+try:  # pragma: no cover - optional acceleration
+    from scipy import sparse
+    from scipy.sparse import csgraph
+except ImportError:  # pragma: no cover
+    sparse = None
+
 from skimage.morphology import skeletonize
 
-from ...core.fracture import FractureLine, FractureNetwork
+from ...core.fracture import FractureNetwork
 
 
 @dataclass
@@ -33,9 +42,12 @@ class DigitiseOptions:
     min_branch_length: float = 0.0
 
 
+IDENTITY_TRANSFORM = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
 def _normalise_transform(transform: Optional[Sequence[float]]) -> Tuple[float, float, float, float, float, float]:
     if transform is None:
-        return (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+        return IDENTITY_TRANSFORM
     if hasattr(transform, "a") and hasattr(transform, "b"):
         return (float(transform.a), float(transform.b), float(transform.c), float(transform.d), float(transform.e), float(transform.f))
     if isinstance(transform, (tuple, list)) and len(transform) == 6:
@@ -70,29 +82,30 @@ def digitise_fracture_network(
     options = options or DigitiseOptions()
     mask = _prepare_mask(array, invert=options.invert)
 
-    skeleton = skeletonize(mask)
-    graph = _skeleton_to_graph(skeleton)
-    if graph.number_of_edges() == 0:
+    skeleton, origin = _skeletonize(mask)
+    nodes, indptr, indices = _skeleton_to_adjacency(skeleton)
+    if indices.size == 0:
         return FractureNetwork(lines=[], crs=None, source=None)
 
-    if nx is None:
-        raise RuntimeError('networkx is required for fracture digitising')
     matrix = _normalise_transform(transform)
-    lines = _graph_to_lines(graph, matrix)
+    lines = _graph_to_lines(nodes, indptr, indices, matrix, skeleton.shape[1], origin)
 
-    if options.simplify_tolerance > 0:
-        simplified_lines = []
-        for line in lines:
-            simplified_lines.append(line.simplify(options.simplify_tolerance, preserve_topology=False))
-        lines = simplified_lines
+    simplify_tolerance = options.simplify_tolerance
+    if simplify_tolerance > 0:
+        lines = _simplify_lines(lines, simplify_tolerance)
 
-    if options.min_branch_length > 0:
-        lines = [line for line in lines if line.length >= options.min_branch_length]
+    min_branch_length = options.min_branch_length
+    lengths = shapely.length(lines)
+    if min_branch_length > 0:
+        lines = lines[lengths >= min_branch_length]
     else:
-        lines = [line for line in lines if line.length > 0]
+        lines = lines[lengths > 0]
 
-    fracture_lines = [FractureLine(geometry=line) for line in lines]
-    return FractureNetwork(lines=fracture_lines)
+    return FractureNetwork.from_geometries(lines)
+
+
+#: Number of raster rows read per windowed request when streaming a band.
+RASTER_CHUNK_ROWS = 1024
 
 
 def digitise_fracture_network_from_raster(
@@ -101,158 +114,379 @@ def digitise_fracture_network_from_raster(
     band: int = 1,
     options: Optional[DigitiseOptions] = None,
 ) -> FractureNetwork:
-    """Digitise a fracture network from a raster file (requires ``rasterio``)."""
+    """Digitise a fracture network from a raster file (requires ``rasterio``).
+
+    The band is streamed in row chunks and converted to a boolean mask on the
+    fly, so peak memory is one chunk of the native dtype plus one byte per
+    pixel instead of the full band at its stored dtype. Skeletonization is a
+    global operation, so the assembled mask is still digitised in one pass.
+    """
 
     if rasterio is None:  # pragma: no cover - runtime guard
         raise RuntimeError("rasterio is required to digitise from raster files")
 
     with rasterio.open(path) as dataset:
-        array = dataset.read(band)
         transform = _normalise_transform(dataset.transform)
-    return digitise_fracture_network(array, transform=transform, options=options)
+        height, width = dataset.height, dataset.width
+        mask = np.empty((height, width), dtype=bool)
+        for row in range(0, height, RASTER_CHUNK_ROWS):
+            stop = min(row + RASTER_CHUNK_ROWS, height)
+            window = rasterio.windows.Window(0, row, width, stop - row)
+            chunk = dataset.read(band, window=window)
+            np.greater(chunk, 0, out=mask[row:stop])
+    return digitise_fracture_network(mask, transform=transform, options=options)
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-NEIGHBOURS = np.array(
-    [
-        (-1, 0),
-        (0, -1),         (0, 1),
-        (1, 0),
-    ]
-)
+def _prepare_mask(array: np.ndarray, *, invert: bool) -> np.ndarray:
+    mask = np.asarray(array)
+    if mask.dtype == np.bool_:
+        # The caller's buffer must not be mutated, so inversion copies; the
+        # plain case passes straight through with no allocation at all.
+        return ~mask if invert else mask
+    if invert:
+        return mask <= 0
+    if mask.dtype == np.uint8:
+        # skeletonization and the bounding-box crop treat any nonzero value
+        # as foreground, so a fresh boolean buffer would be pure churn.
+        return mask
+    return mask > 0
+
+
+def _skeletonize(mask: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Skeletonize the bounding box of the mask, returning it with its origin.
+
+    Cropping to the nonzero extent avoids running the thinning passes over
+    empty border regions, and the contiguous uint8 copy spares scikit-image an
+    internal dtype conversion. Lee's algorithm needs fewer passes than the
+    default Zhang thinning on large masks; older scikit-image releases without
+    the ``method`` keyword fall back to the default.
+    """
+
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return np.zeros((0, 0), dtype=bool), (0, 0)
+    cols = np.flatnonzero(mask.any(axis=0))
+    row0, row1 = int(rows[0]), int(rows[-1]) + 1
+    col0, col1 = int(cols[0]), int(cols[-1]) + 1
 
+    window = np.ascontiguousarray(mask[row0:row1, col0:col1], dtype=np.uint8)
+    try:
+        skeleton = skeletonize(window, method="lee")
+    except TypeError:  # pragma: no cover - scikit-image without method kwarg
+        skeleton = skeletonize(window)
+    return skeleton, (row0, col0)
 
-def _apply_transform(matrix: Tuple[float, float, float, float, float, float], col: float, row: float) -> Tuple[float, float]:
-    a, b, c, d, e, f = matrix
-    x = a * col + b * row + c
-    y = d * col + e * row + f
-    return float(x), float(y)
 
+def _skeleton_to_adjacency(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build a CSR adjacency (``nodes``, ``indptr``, ``indices``) for the skeleton.
 
-def _prepare_mask(array: np.ndarray, *, invert: bool) -> np.ndarray:
-    mask = np.asarray(array)
-    if mask.dtype != np.bool_:
-        mask = mask > 0
-    if invert:
-        mask = ~mask
-    return mask
-
-
-def _skeleton_to_graph(mask: np.ndarray) -> nx.Graph:
-    rows, cols = np.nonzero(mask)
-    graph: nx.Graph = nx.Graph()
-    for r, c in zip(rows, cols):
-        node = (int(r), int(c))
-        graph.add_node(node)
-
-    for r, c in zip(rows, cols):
-        node = (int(r), int(c))
-        for dr, dc in NEIGHBOURS:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < mask.shape[0] and 0 <= nc < mask.shape[1]:
-                if mask[nr, nc]:
-                    neighbour = (int(nr), int(nc))
-                    if node != neighbour:
-                        weight = float(np.hypot(dr, dc))
-                        graph.add_edge(node, neighbour, weight=weight)
-    return graph
-
-
-def _graph_to_lines(graph: nx.Graph, transform: Tuple[float, float, float, float, float, float]) -> List[LineString]:
-    visited: Set[frozenset] = set()
-    lines: List[LineString] = []
-
-    significant_nodes = [n for n in graph.nodes if graph.degree(n) != 2]
-    for node in significant_nodes:
-        for nbr in graph.neighbors(node):
-            edge = frozenset((node, nbr))
-            if edge in visited:
-                continue
-            path = _walk_path(graph, node, nbr, visited)
-            line = _path_to_linestring(path, transform)
-            if line is not None:
-                lines.append(line)
-
-    for node in graph.nodes:
-        for nbr in graph.neighbors(node):
-            edge = frozenset((node, nbr))
-            if edge in visited:
-                continue
-            path = _walk_cycle(graph, node, nbr, visited)
-            line = _path_to_linestring(path, transform, closed=True)
-            if line is not None:
-                lines.append(line)
-    return lines
+    ``nodes`` maps each compact node index to its flat ``r * width + c`` pixel
+    id; ``indices[indptr[v]:indptr[v + 1]]`` lists the neighbours of node ``v``
+    as compact indices. Compared with a dict-of-dict graph this keeps neighbour
+    iteration to contiguous integer reads and costs a few bytes per edge.
+    """
+
+    mask = np.asarray(mask, dtype=bool)
+    width = mask.shape[1]
+
+    # 4-connected adjacency falls out of two shifted boolean ANDs: a pixel and
+    # its lower (respectively right-hand) neighbour are connected exactly when
+    # both masks are set. Nodes are flat ``r * width + c`` indices so edge
+    # construction and hashing stay integer-only.
+    down = mask[:-1, :] & mask[1:, :]
+    right = mask[:, :-1] & mask[:, 1:]
+
+    rows, cols = np.nonzero(down)
+    down_src = rows.astype(np.int64) * width + cols
+    rows, cols = np.nonzero(right)
+    right_src = rows.astype(np.int64) * width + cols
+
+    src = np.concatenate([down_src, right_src])
+    dst = np.concatenate([down_src + width, right_src + 1])
+
+    # Symmetrise, compress pixel ids to 0..N-1, and bucket by source node.
+    u = np.concatenate([src, dst])
+    v = np.concatenate([dst, src])
+    nodes = np.unique(u)
+    u = np.searchsorted(nodes, u)
+    v = np.searchsorted(nodes, v)
+    order = np.argsort(u, kind="stable")
+    indices = v[order]
+    indptr = np.zeros(nodes.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=nodes.shape[0]), out=indptr[1:])
+    return nodes, indptr, indices
+
+
+def _graph_to_lines(
+    nodes: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    transform: Tuple[float, float, float, float, float, float],
+    width: int,
+    origin: Tuple[int, int],
+) -> np.ndarray:
+    degree = np.diff(indptr)
+    seeds = np.flatnonzero(degree != 2)
+    verts, offsets, visited = _trace_branches(indptr, indices, degree, seeds)
+
+    if not visited.all():
+        # Whatever pass 1 left untouched lives in pure degree-2 components,
+        # i.e. isolated rings.
+        if sparse is not None:
+            cycle_verts, cycle_offsets = _trace_cycle_components(indptr, indices, visited)
+        else:
+            cycle_verts, cycle_offsets = _trace_cycles(indptr, indices, visited)
+        offsets = np.concatenate([offsets, cycle_offsets[1:] + verts.shape[0]])
+        verts = np.concatenate([verts, cycle_verts])
+
+    if verts.size == 0:
+        return np.empty(0, dtype=object)
+
+    # One C call builds every branch geometry from the flat coordinate table;
+    # the per-point line assignment comes from repeating each path id by its
+    # vertex count.
+    coords = _path_to_coords(verts, nodes, transform, width, origin)
+    counts = np.diff(offsets)
+    line_ids = np.repeat(np.arange(counts.shape[0]), counts)
+    geoms = shapely.linestrings(coords, indices=line_ids)
+    return geoms[shapely.length(geoms) > 0]
+
+
+def _mark_reverse(indptr: np.ndarray, indices: np.ndarray, visited: np.ndarray, node: int, neighbour: int) -> None:
+    for slot in range(indptr[node], indptr[node + 1]):
+        if indices[slot] == neighbour:
+            visited[slot] = True
+            return
 
 
 def _walk_path(
-    graph: nx.Graph,
-    start: Tuple[int, int],
-    neighbour: Tuple[int, int],
-    visited: Set[frozenset],
-) -> List[Tuple[int, int]]:
-    path = [start]
-    current = neighbour
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    degree: np.ndarray,
+    visited: np.ndarray,
+    start: int,
+    first_slot: int,
+    verts: np.ndarray,
+    cursor: int,
+) -> int:
+    visited[first_slot] = True
     previous = start
-    visited.add(frozenset((start, neighbour)))
+    current = indices[first_slot]
+    _mark_reverse(indptr, indices, visited, current, start)
+    verts[cursor] = start
+    cursor += 1
 
     while True:
-        path.append(current)
-        neighbours = [n for n in graph.neighbors(current) if n != previous]
-        if len(neighbours) != 1 or graph.degree(current) != 2:
+        verts[cursor] = current
+        cursor += 1
+        if degree[current] != 2:
+            break
+        next_node = -1
+        next_slot = -1
+        for slot in range(indptr[current], indptr[current + 1]):
+            if indices[slot] != previous:
+                next_node = indices[slot]
+                next_slot = slot
+                break
+        if next_node < 0:
             break
-        next_node = neighbours[0]
-        visited.add(frozenset((current, next_node)))
+        visited[next_slot] = True
+        _mark_reverse(indptr, indices, visited, next_node, current)
         previous, current = current, next_node
-    return path
+    return cursor
 
 
 def _walk_cycle(
-    graph: nx.Graph,
-    start: Tuple[int, int],
-    neighbour: Tuple[int, int],
-    visited: Set[frozenset],
-) -> List[Tuple[int, int]]:
-    path = [start]
-    current = neighbour
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    visited: np.ndarray,
+    start: int,
+    first_slot: int,
+    verts: np.ndarray,
+    cursor: int,
+) -> int:
+    visited[first_slot] = True
     previous = start
-    visited.add(frozenset((start, neighbour)))
+    current = indices[first_slot]
+    _mark_reverse(indptr, indices, visited, current, start)
+    verts[cursor] = start
+    cursor += 1
 
     while current != start:
-        path.append(current)
-        neighbours = [n for n in graph.neighbors(current) if n != previous]
-        if not neighbours:
-            break
-        next_node = neighbours[0]
-        edge = frozenset((current, next_node))
-        if edge in visited:
+        verts[cursor] = current
+        cursor += 1
+        next_node = -1
+        next_slot = -1
+        for slot in range(indptr[current], indptr[current + 1]):
+            if indices[slot] != previous:
+                next_node = indices[slot]
+                next_slot = slot
+                break
+        if next_node < 0 or visited[next_slot]:
             break
-        visited.add(edge)
+        visited[next_slot] = True
+        _mark_reverse(indptr, indices, visited, next_node, current)
         previous, current = current, next_node
-    if path[-1] != start:
-        path.append(start)
-    return path
+    if verts[cursor - 1] != start:
+        verts[cursor] = start
+        cursor += 1
+    return cursor
+
+
+def _trace_branches(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    degree: np.ndarray,
+    seeds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Enumerate every junction-to-junction branch of the skeleton.
+
+    ``seeds`` lists the junction/endpoint nodes (degree != 2) from which the
+    branch walks start. Returns a flat ``verts`` array of compact node indices,
+    an ``offsets`` array delimiting each path, and the per-slot visited flags
+    so cycle tracing can pick up the leftovers.
+    """
+
+    num_nodes = degree.shape[0]
+    num_slots = indices.shape[0]
+    visited = np.zeros(num_slots, dtype=np.bool_)
+    # Each undirected edge is traversed once (E interior steps) and each path
+    # adds one endpoint or closing vertex, so num_slots + num_nodes is a safe
+    # upper bound on the total vertex count.
+    verts = np.empty(num_slots + num_nodes + 1, dtype=np.int64)
+    offsets = np.empty(num_slots // 2 + 2, dtype=np.int64)
+    offsets[0] = 0
+    cursor = 0
+    num_paths = 0
+
+    for i in range(seeds.shape[0]):
+        start = seeds[i]
+        for slot in range(indptr[start], indptr[start + 1]):
+            if visited[slot]:
+                continue
+            cursor = _walk_path(indptr, indices, degree, visited, start, slot, verts, cursor)
+            num_paths += 1
+            offsets[num_paths] = cursor
+
+    return verts[:cursor], offsets[:num_paths + 1], visited
+
+
+def _trace_cycles(indptr: np.ndarray, indices: np.ndarray, visited: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Walk the residual cycles edge by edge (fallback without scipy)."""
+
+    num_nodes = indptr.shape[0] - 1
+    num_slots = indices.shape[0]
+    verts = np.empty(num_slots + num_nodes + 1, dtype=np.int64)
+    offsets = np.empty(num_slots // 2 + 2, dtype=np.int64)
+    offsets[0] = 0
+    cursor = 0
+    num_paths = 0
+
+    for start in range(num_nodes):
+        for slot in range(indptr[start], indptr[start + 1]):
+            if visited[slot]:
+                continue
+            cursor = _walk_cycle(indptr, indices, visited, start, slot, verts, cursor)
+            num_paths += 1
+            offsets[num_paths] = cursor
+
+    return verts[:cursor], offsets[:num_paths + 1]
+
 
+def _trace_cycle_components(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    visited: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Order residual cycles via compiled SciPy graph routines.
 
-def _path_to_linestring(
-    path: Iterable[Tuple[int, int]],
+    Every edge left unvisited after branch tracing belongs to a connected
+    component made purely of degree-2 nodes, so a depth-first preorder from
+    any member yields the ring sequence directly.
+    """
+
+    num_nodes = indptr.shape[0] - 1
+    graph = sparse.csr_matrix(
+        (np.ones(indices.shape[0], dtype=np.int8), indices, indptr),
+        shape=(num_nodes, num_nodes),
+    )
+    _, labels = csgraph.connected_components(graph, directed=False)
+    slot_sources = np.repeat(np.arange(num_nodes), np.diff(indptr))
+    open_components = np.unique(labels[slot_sources[~visited]])
+
+    parts = []
+    offsets = [0]
+    total = 0
+    for component in open_components:
+        members = np.flatnonzero(labels == component)
+        order = csgraph.depth_first_order(
+            graph, int(members[0]), directed=False, return_predecessors=False
+        )
+        ring = np.append(order, order[0])
+        parts.append(ring)
+        total += ring.shape[0]
+        offsets.append(total)
+    return np.concatenate(parts).astype(np.int64), np.array(offsets, dtype=np.int64)
+
+
+if njit is not None:  # pragma: no cover - only active with numba installed
+    # cache=True persists the compiled kernels to disk so one-shot CLI runs
+    # skip the multi-second JIT warm-up; bounds checks are redundant given the
+    # preallocated buffer size proofs above.
+    _jit = njit(cache=True, boundscheck=False)
+    _mark_reverse = _jit(_mark_reverse)
+    _walk_path = _jit(_walk_path)
+    _walk_cycle = _jit(_walk_cycle)
+    _trace_branches = _jit(_trace_branches)
+    _trace_cycles = _jit(_trace_cycles)
+
+
+#: Minimum number of geometries before simplification is spread over threads.
+PARALLEL_MIN_GEOMETRIES = 8192
+
+
+def _simplify_lines(lines: np.ndarray, tolerance: float) -> np.ndarray:
+    """Simplify a geometry array, fanning out over threads for large networks.
+
+    Shapely 2.0 ufuncs release the GIL, so chunking the array across a thread
+    pool scales the per-branch RDP work across cores without any pickling.
+    """
+
+    workers = os.cpu_count() or 1
+    if lines.shape[0] < PARALLEL_MIN_GEOMETRIES or workers < 2:
+        return shapely.simplify(lines, tolerance, preserve_topology=False)
+
+    chunks = np.array_split(lines, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            lambda chunk: shapely.simplify(chunk, tolerance, preserve_topology=False),
+            chunks,
+        )
+    return np.concatenate(list(results))
+
+
+def _path_to_coords(
+    path: np.ndarray,
+    nodes: np.ndarray,
     transform: Tuple[float, float, float, float, float, float],
-    *,
-    closed: bool = False,
-) -> Optional[LineString]:
-    coords: List[Tuple[float, float]] = []
-    for r, c in path:
-        x, y = _apply_transform(transform, c + 0.5, r + 0.5)
-        coords.append((x, y))
-    if len(coords) < 2:
-        return None
-    if closed and coords[0] != coords[-1]:
-        coords.append(coords[0])
-    line = LineString(coords)
-    if line.is_empty or line.length == 0:
-        return None
-    return line
+    width: int,
+    origin: Tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """Map a path of compact node indices to an ``(N, 2)`` coordinate array."""
+
+    flat = nodes[path]
+    cols = flat % width + (origin[1] + 0.5)
+    rows = flat // width + (origin[0] + 0.5)
+    if transform == IDENTITY_TRANSFORM:
+        # Ungeoreferenced rasters map pixel centres straight to coordinates,
+        # so the affine multiply-adds can be skipped outright.
+        return np.column_stack([cols, rows])
+    a, b, c, d, e, f = transform
+    x = a * cols + b * rows + c
+    y = d * cols + e * rows + f
+    return np.column_stack([x, y])
 
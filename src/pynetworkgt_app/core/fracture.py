@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
+import shapely
 from shapely.geometry import LineString
 
 try:  # pragma: no cover - import guard
@@ -22,24 +24,70 @@ class FractureLine:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
 class FractureNetwork:
-    """Collection of fracture lines with optional metadata."""
+    """Collection of fracture lines with optional metadata.
+
+    Geometries are stored as a single object array alongside a parallel list
+    of property dicts (structure-of-arrays), so bulk operations work on the
+    arrays directly. :attr:`lines` materialises :class:`FractureLine` views on
+    demand for callers that iterate fracture by fracture.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[FractureLine] = (),
+        crs: Optional[str] = None,
+        source: Optional[Path] = None,
+    ) -> None:
+        lines = list(lines)
+        geometries = np.empty(len(lines), dtype=object)
+        for index, line in enumerate(lines):
+            geometries[index] = line.geometry
+        self.geometries = geometries
+        self.properties: Optional[List[Dict[str, Any]]] = [line.properties for line in lines]
+        self.crs = crs
+        self.source = source
+
+    @classmethod
+    def from_geometries(
+        cls,
+        geometries: Sequence[LineString],
+        properties: Optional[Iterable[Dict[str, Any]]] = None,
+        *,
+        crs: Optional[str] = None,
+        source: Optional[Path] = None,
+    ) -> "FractureNetwork":
+        """Build a network straight from a geometry array, skipping per-line objects.
+
+        ``properties`` may be ``None`` when no fracture carries attributes;
+        empty dicts are then created lazily if :attr:`lines` is accessed.
+        """
 
-    lines: Iterable[FractureLine]
-    crs: Optional[str] = None
-    source: Optional[Path] = None
+        network = cls.__new__(cls)
+        network.geometries = np.asarray(geometries, dtype=object)
+        network.properties = list(properties) if properties is not None else None
+        network.crs = crs
+        network.source = source
+        return network
 
-    def __post_init__(self) -> None:
-        self.lines = list(self.lines)
+    @property
+    def lines(self) -> List[FractureLine]:
+        """Per-fracture views over the underlying geometry/property arrays."""
+
+        if self.properties is None:
+            self.properties = [{} for _ in range(len(self.geometries))]
+        return [
+            FractureLine(geometry=geometry, properties=props)
+            for geometry, props in zip(self.geometries, self.properties)
+        ]
 
     def __len__(self) -> int:
-        return len(self.lines)
+        return len(self.geometries)
 
     def total_length(self) -> float:
         """Return the cumulative length of all fractures."""
 
-        return sum(line.geometry.length for line in self.lines)
+        return float(shapely.length(self.geometries).sum())
 
     def to_geodataframe(self):
         """Convert the fracture network into a GeoDataFrame.
@@ -58,11 +106,7 @@ class FractureNetwork:
         if gpd is None:  # pragma: no cover - executed without geopandas
             raise ImportError("geopandas is required to convert to GeoDataFrame")
 
-        records: List[Dict[str, Any]] = []
-        for line in self.lines:
-            record = dict(line.properties)
-            record["geometry"] = line.geometry
-            records.append(record)
-
-        return gpd.GeoDataFrame(records, geometry="geometry", crs=self.crs)
+        # The geometry array feeds the GeoDataFrame directly; no per-row dict
+        # copying or record iteration is involved.
+        return gpd.GeoDataFrame(self.properties, geometry=self.geometries, crs=self.crs)
 
@@ -2,22 +2,127 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from shapely.geometry.base import BaseGeometry
+import numpy as np
+import shapely
 
 try:  # pragma: no cover - import guard for PySide6
-    from PySide6.QtCore import QPointF, QRectF, QSize, Qt
-    from PySide6.QtGui import QColor, QCursor, QFont, QFontMetrics, QImage, QPainter, QPainterPath, QPen
-    from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsScene, QGraphicsView
+    from PySide6.QtCore import QLineF, QPointF, QRect, QRectF, QSize, Qt
+    from PySide6.QtGui import QColor, QCursor, QFont, QFontMetrics, QImage, QPainter, QPainterPath, QPen, QPicture, QPolygonF
+    from PySide6.QtWidgets import QGraphicsItem, QGraphicsPathItem, QGraphicsScene, QGraphicsView
 except ImportError as exc:  # pragma: no cover
     raise RuntimeError("PySide6 is required to use the GUI components") from exc
 
 from ..core.fracture import FractureNetwork
 
 
+def _extract_display_coords(geometries) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Flatten network geometries into display-space coordinates and part ids.
+
+    Multi-part geometries are exploded so every LineString part breaks the
+    path, non-line geometries are dropped (matching the old per-fracture
+    dispatch), and the Y axis is negated in one vectorized pass since scene
+    space points down.
+    """
+
+    parts = shapely.get_parts(np.asarray(geometries, dtype=object))
+    parts = parts[shapely.get_type_id(parts) == 1]
+    coords, indices = shapely.get_coordinates(parts, return_index=True)
+    coords[:, 1] = -coords[:, 1]
+    return coords, indices
+
+
+def _build_painter_path(coords: "np.ndarray", indices: "np.ndarray") -> QPainterPath:
+    """Assemble a single QPainterPath from flat coordinates in one pass."""
+
+    path = QPainterPath()
+    # The element count is known upfront; reserving avoids the repeated
+    # element-array reallocations incremental appends would cause.
+    path.reserve(coords.shape[0])
+    move_to = path.moveTo
+    line_to = path.lineTo
+    previous = -1
+    # Iterating plain Python lists avoids an ndarray scalar box per access.
+    for (x, y), part in zip(coords.tolist(), indices.tolist()):
+        if part != previous:
+            move_to(x, y)
+            previous = part
+        else:
+            line_to(x, y)
+    return path
+
+
+def _grid_positions(start: float, stop: float, spacing: float) -> "np.ndarray":
+    """Grid-line positions covering ``[start, stop]``, capped at 2000 lines.
+
+    The first position is snapped down to a spacing multiple so grid lines
+    stay anchored to world coordinates while panning.
+    """
+
+    first = spacing * np.floor(start / spacing)
+    return np.arange(first, stop + spacing, spacing)[:2000]
+
+
+def _effective_grid_spacing(spacing: float, pixels_per_unit: float) -> Optional[float]:
+    """Grid spacing adjusted so lines stay legible at the current zoom.
+
+    Below two device pixels per line the grid would repaint every pixel
+    column as moire, so drawing is skipped entirely (``None``); below eight
+    pixels the spacing is bumped to the next power of ten that clears the
+    limit.
+    """
+
+    pixels_per_line = spacing * pixels_per_unit
+    if pixels_per_line < 2.0:
+        return None
+    if pixels_per_line < 8.0:
+        spacing *= 10.0 ** int(np.ceil(np.log10(8.0 / pixels_per_line)))
+    return spacing
+
+
+#: Reusable ARGB32 buffers for image export, keyed by size. Batch and tile
+#: exports hit the same handful of sizes, and a 4K ARGB32 allocation alone is
+#: tens of megabytes of zero-fill per call.
+_IMAGE_POOL: Dict[Tuple[int, int], List[QImage]] = {}
+_IMAGE_POOL_MAX = 4
+
+
+def _borrow_image(width: int, height: int) -> QImage:
+    pool = _IMAGE_POOL.get((width, height))
+    if pool:
+        return pool.pop()
+    return QImage(width, height, QImage.Format_ARGB32)
+
+
+def _return_image(image: QImage) -> None:
+    pool = _IMAGE_POOL.setdefault((image.width(), image.height()), [])
+    if len(pool) < _IMAGE_POOL_MAX:
+        pool.append(image)
+
+
+def _scale_bar_polyline(x_start: float, x_end: float, y: float) -> QPolygonF:
+    """Scale bar with its endcap ticks as one connected polyline.
+
+    The trace retraces half of each tick so the bar and both ticks render
+    with a single draw call.
+    """
+
+    return QPolygonF(
+        [
+            QPointF(x_start, y - 5),
+            QPointF(x_start, y + 5),
+            QPointF(x_start, y),
+            QPointF(x_end, y),
+            QPointF(x_end, y + 5),
+            QPointF(x_end, y - 5),
+        ]
+    )
+
+
 @dataclass
 class CanvasLayer:
     """Represents an individual layer rendered on the canvas."""
@@ -27,6 +132,15 @@ class CanvasLayer:
     color: QColor
     width: float
     z_value: float = 0.0
+    bounds: Optional[QRectF] = None
+    geometries: Optional["np.ndarray"] = None
+    lengths: Optional["np.ndarray"] = None
+    #: Structure-of-arrays view of the layer: flat display-space vertices and
+    #: the part index of each vertex, shared by path builds and LOD rebuilds.
+    coords: Optional["np.ndarray"] = None
+    indices: Optional["np.ndarray"] = None
+    lod_paths: Dict[int, QPainterPath] = field(default_factory=dict)
+    lod_level: Optional[int] = None
 
 
 class NetworkCanvas(QGraphicsView):
@@ -55,6 +169,8 @@ class NetworkCanvas(QGraphicsView):
         self.setCursor(QCursor(Qt.OpenHandCursor))
 
         self._layers: List[CanvasLayer] = []
+        self._cached_scene_rect: Optional[QRectF] = None
+        self._defer_fit = False
         self._color_index = 0
         self._auto_fit_pending = True
         self._zoom_limits = (0.05, 100.0)
@@ -69,17 +185,45 @@ class NetworkCanvas(QGraphicsView):
         self._grid_pen = QPen(QColor(0, 0, 0, 100), 1, Qt.SolidLine)
         self._scale_pen = QPen(Qt.black, 2)
         self._font = QFont()
+        # The overlay font never changes after construction, so its metrics
+        # can be resolved once instead of per paint.
+        self._font_metrics = QFontMetrics(self._font)
+        self._scale_bar_picture: Optional[QPicture] = None
+        self._scale_bar_picture_key: Optional[Tuple] = None
+        self._pixels_per_scene_unit = 1.0
 
     # ------------------------------------------------------------------
     # Layer handling
     # ------------------------------------------------------------------
+    @contextmanager
+    def _batched_updates(self):
+        """Defer scene fits and updates until a batch of layer changes ends.
+
+        ``reorder_layers`` and ``_fit_scene`` short-circuit while the flag is
+        set, so a sequence of layer mutations triggers exactly one fit and one
+        scene update on exit instead of one per mutation. Nesting is a no-op.
+        """
+
+        if self._defer_fit:
+            yield
+            return
+        self._defer_fit = True
+        try:
+            yield
+        finally:
+            self._defer_fit = False
+        self._fit_scene()
+        self._scene.update()
+
     def clear_layers(self) -> None:
         for layer in self._layers:
             for item in layer.items:
                 self._scene.removeItem(item)
         self._layers.clear()
+        self._cached_scene_rect = None
         self._scene.clear()
         self.resetTransform()
+        self._refresh_pixels_per_unit()
         self._color_index = 0
         self._auto_fit_pending = True
 
@@ -97,27 +241,42 @@ class NetworkCanvas(QGraphicsView):
         layer_name = name or network.source.name if network.source else "Network"
         qcolor = self._coerce_color(color)
 
-        painter_path = QPainterPath()
-        for fracture in network.lines:
-            path = self._create_path(fracture.geometry)
-            if path is not None:
-                painter_path.addPath(path)
+        coords, indices = _extract_display_coords(network.geometries)
+        painter_path = _build_painter_path(coords, indices)
 
         pen = QPen(qcolor)
         pen.setWidthF(width)
 
         item = QGraphicsPathItem(painter_path)
         item.setPen(pen)
+        # Cache the stroked path as a device-space pixmap: panning at a fixed
+        # zoom blits the pixmap instead of re-stroking every segment. This is
+        # Qt's built-in backing store for translation-only transform changes;
+        # a hand-rolled QImage composite in drawBackground would duplicate it
+        # (and its zoom invalidation) without being any faster.
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self._scene.addItem(item)
 
-        layer = CanvasLayer(name=layer_name, items=[item], color=qcolor, width=width)
+        geometries = np.asarray(network.geometries, dtype=object)
+        layer = CanvasLayer(
+            name=layer_name,
+            items=[item],
+            color=qcolor,
+            width=width,
+            bounds=QRectF(item.boundingRect()),
+            geometries=geometries,
+            lengths=shapely.length(geometries),
+            coords=coords,
+            indices=indices,
+            lod_paths={0: painter_path},
+            lod_level=0,
+        )
         self._layers.append(layer)
-        self.reorder_layers(self._layers)
-        if auto_fit:
-            self._auto_fit_pending = True
-            self._fit_scene(force=True)
-        else:
-            self._fit_scene(force=False)
+        self._cached_scene_rect = None
+        with self._batched_updates():
+            self.reorder_layers(self._layers)
+            if auto_fit:
+                self._auto_fit_pending = True
         return layer
 
     def remove_layer(self, layer: CanvasLayer) -> None:
@@ -126,15 +285,16 @@ class NetworkCanvas(QGraphicsView):
         for item in layer.items:
             self._scene.removeItem(item)
         self._layers.remove(layer)
-        self._scene.update()
+        self._cached_scene_rect = None
         self._fit_scene()
 
     def set_layer_visibility(self, layer: CanvasLayer, visible: bool) -> None:
         if layer not in self._layers:
             return
+        # setVisible schedules the item's own dirty region; a scene-wide
+        # update broadcast here would repaint the full viewport.
         for item in layer.items:
             item.setVisible(visible)
-        self._scene.update()
 
     def reorder_layers(self, ordered_layers: List[CanvasLayer]) -> None:
         ordered: List[CanvasLayer] = []
@@ -151,7 +311,8 @@ class NetworkCanvas(QGraphicsView):
             layer.z_value = z_value
             for item in layer.items:
                 item.setZValue(z_value)
-        self._scene.update()
+        if self._defer_fit:
+            return
         self._fit_scene()
 
     def update_layer_style(
@@ -172,7 +333,13 @@ class NetworkCanvas(QGraphicsView):
             pen.setColor(layer.color)
             pen.setWidthF(layer.width)
             item.setPen(pen)
-        self._scene.update()
+            # Explicitly drop the cached device pixmap for the restyled item.
+            item.update()
+        # Skip the broadcast while a batch is running (either our own deferred
+        # fit or a caller that disabled widget updates around a loop); the
+        # batch exit issues one invalidation for all restyled layers.
+        if not self._defer_fit and self.updatesEnabled():
+            self._scene.update()
 
     def reset_view(self) -> None:
         self._auto_fit_pending = True
@@ -243,26 +410,29 @@ class NetworkCanvas(QGraphicsView):
             painter.end()
             return True
 
-        image = QImage(width, height, QImage.Format_ARGB32)
-        image.fill(bg_color)
-        dots_per_meter = int(dpi * 39.3701)
-        image.setDotsPerMeterX(dots_per_meter)
-        image.setDotsPerMeterY(dots_per_meter)
-
-        painter = QPainter(image)
-        self._render_export(
-            painter,
-            scene_rect,
-            width,
-            height,
-            title_text,
-            include_legend,
-            show_scale,
-            show_grid,
-        )
-        painter.end()
+        image = _borrow_image(width, height)
+        try:
+            image.fill(bg_color)
+            dots_per_meter = int(dpi * 39.3701)
+            image.setDotsPerMeterX(dots_per_meter)
+            image.setDotsPerMeterY(dots_per_meter)
+
+            painter = QPainter(image)
+            self._render_export(
+                painter,
+                scene_rect,
+                width,
+                height,
+                title_text,
+                include_legend,
+                show_scale,
+                show_grid,
+            )
+            painter.end()
 
-        return image.save(str(path), fmt)
+            return image.save(str(path), fmt)
+        finally:
+            _return_image(image)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -284,6 +454,7 @@ class NetworkCanvas(QGraphicsView):
             for item in layer.items:
                 self._scene.removeItem(item)
         self._layers.clear()
+        self._cached_scene_rect = None
 
 
     def _render_export(
@@ -320,7 +491,7 @@ class NetworkCanvas(QGraphicsView):
         painter.setPen(QPen(Qt.black))
         font = self._font
         painter.setFont(font)
-        metrics = QFontMetrics(font)
+        metrics = self._font_metrics
         y_offset = margin
 
         if title:
@@ -353,6 +524,11 @@ class NetworkCanvas(QGraphicsView):
         spacing = self._grid_spacing
         if spacing <= 0:
             return
+        scale_x = width / scene_rect.width() if scene_rect.width() else 1.0
+        scale_y = height / scene_rect.height() if scene_rect.height() else 1.0
+        spacing = _effective_grid_spacing(spacing, scale_x)
+        if spacing is None:
+            return
         painter.save()
         painter.setPen(self._grid_pen)
         left = min(scene_rect.left(), scene_rect.right())
@@ -364,30 +540,12 @@ class NetworkCanvas(QGraphicsView):
             painter.restore()
             return
 
-        scale_x = width / scene_rect.width() if scene_rect.width() else 1.0
-        scale_y = height / scene_rect.height() if scene_rect.height() else 1.0
-
-        start_x = spacing * int(left // spacing)
-        if start_x > left:
-            start_x -= spacing
-        x = start_x
-        count = 0
-        while x <= right and count < 2000:
-            px = (x - left) * scale_x
-            painter.drawLine(px, 0, px, height)
-            x += spacing
-            count += 1
-
-        start_y = spacing * int(bottom // spacing)
-        if start_y > bottom:
-            start_y -= spacing
-        y = start_y
-        count = 0
-        while y <= top and count < 2000:
-            py = height - (y - bottom) * scale_y
-            painter.drawLine(0, py, width, py)
-            y += spacing
-            count += 1
+        xs = (_grid_positions(left, right, spacing) - left) * scale_x
+        ys = height - (_grid_positions(bottom, top, spacing) - bottom) * scale_y
+        lines = [QLineF(px, 0.0, px, height) for px in xs.tolist()]
+        lines += [QLineF(0.0, py, width, py) for py in ys.tolist()]
+        if lines:
+            painter.drawLines(lines)
         painter.restore()
 
     def _draw_export_scale_bar(
@@ -412,19 +570,27 @@ class NetworkCanvas(QGraphicsView):
         x_end = x_start + bar_pixels
         y = height - margin
         painter.setPen(self._scale_pen)
-        painter.drawLine(int(x_start), int(y), int(x_end), int(y))
-        painter.drawLine(int(x_start), int(y - 5), int(x_start), int(y + 5))
-        painter.drawLine(int(x_end), int(y - 5), int(x_end), int(y + 5))
+        painter.drawPolyline(_scale_bar_polyline(x_start, x_end, y))
         text = f"{actual_units:.2f} {self._scale_bar_units}"
         painter.setFont(self._font)
-        metrics = QFontMetrics(self._font)
         painter.drawText(int(x_start), int(y - 8), text)
         painter.restore()
 
+    def _layers_bounding_rect(self) -> QRectF:
+        """Union of the cached layer bounds; avoids a full scene traversal."""
+
+        if self._cached_scene_rect is None:
+            rect = QRectF()
+            for layer in self._layers:
+                if layer.bounds is not None:
+                    rect = rect.united(layer.bounds)
+            self._cached_scene_rect = rect
+        return QRectF(self._cached_scene_rect)
+
     def _fit_scene(self, force: bool = False) -> None:
-        if not self._layers:
+        if self._defer_fit or not self._layers:
             return
-        scene_rect = self._scene.itemsBoundingRect()
+        scene_rect = self._layers_bounding_rect()
         if scene_rect.isNull():
             return
         margin = max(scene_rect.width(), scene_rect.height()) * 0.05
@@ -434,33 +600,8 @@ class NetworkCanvas(QGraphicsView):
             self.resetTransform()
             self.fitInView(scene_rect, Qt.KeepAspectRatio)
             self._auto_fit_pending = False
-
-    def _create_path(self, geometry: BaseGeometry) -> Optional[QPainterPath]:
-        geom_type = geometry.geom_type
-        if geom_type == "LineString":
-            return self._path_from_linestring(geometry)
-        if geom_type == "MultiLineString":
-            path = QPainterPath()
-            for part in geometry.geoms:  # type: ignore[attr-defined]
-                sub = self._path_from_linestring(part)
-                if sub is not None:
-                    path.addPath(sub)
-            return path
-        return None
-
-    def _path_from_linestring(self, linestring) -> Optional[QPainterPath]:
-        coords = list(linestring.coords)
-        if len(coords) < 2:
-            return None
-        first_x, first_y = coords[0][0], coords[0][1]
-        path = QPainterPath(self._map_point(first_x, first_y))
-        for coord in coords[1:]:
-            x, y = coord[0], coord[1]
-            path.lineTo(self._map_point(x, y))
-        return path
-
-    def _map_point(self, x: float, y: float) -> QPointF:
-        return QPointF(x, -y)
+            self._refresh_pixels_per_unit()
+            self._rebuild_lod_paths()
 
     def _coerce_color(self, color: Optional[QColor]) -> QColor:
         if color is not None:
@@ -483,31 +624,119 @@ class NetworkCanvas(QGraphicsView):
     def zoom_out(self) -> None:
         self._apply_zoom(1.0 / self._zoom_step)
 
+    def _compute_clamped_scale(self, factor: float) -> Optional[float]:
+        """Resulting scale for a zoom factor, or None when out of limits."""
+
+        new_scale = self.transform().m11() * factor
+        min_scale, max_scale = self._zoom_limits
+        if new_scale < min_scale or new_scale > max_scale:
+            return None
+        return new_scale
+
     def _apply_zoom(self, factor: float) -> None:
         if not self._layers:
             return
-        current_scale = self.transform().m11()
-        new_scale = current_scale * factor
-        min_scale, max_scale = self._zoom_limits
-        if new_scale < min_scale or new_scale > max_scale:
+        if self._compute_clamped_scale(factor) is None:
+            return
+        # One setTransform instead of scale() keeps this a single transform
+        # event per zoom step.
+        transform = self.transform()
+        transform.scale(factor, factor)
+        self.setTransform(transform)
+        self._refresh_pixels_per_unit()
+        self._rebuild_lod_paths()
+
+    def _refresh_pixels_per_unit(self) -> None:
+        """Re-derive the cached device-pixels-per-scene-unit factor.
+
+        Called at every site that mutates the view transform; overriding
+        ``scale``/``setTransform`` would miss Qt-internal C++ callers, which
+        never dispatch to Python overrides of non-virtual methods.
+        """
+
+        self._pixels_per_scene_unit = abs(self.transform().m11())
+
+    def _rebuild_lod_paths(self) -> None:
+        """Swap layer paths to the detail level matching the current zoom.
+
+        Scales are bucketed on a log2 ladder; zoomed-out buckets simplify
+        each fracture to roughly one device pixel and drop fractures that
+        project below a pixel altogether. Paths are cached per bucket so
+        re-crossing a threshold is a cheap setPath swap.
+        """
+
+        scale = abs(self.transform().m11())
+        if scale <= 0:
             return
-        self.scale(factor, factor)
+        level = min(int(np.floor(np.log2(scale))), 0)
+        for layer in self._layers:
+            if layer.geometries is None or not layer.items:
+                continue
+            if layer.lod_level == level:
+                continue
+            path = layer.lod_paths.get(level)
+            if path is None:
+                if level >= 0:
+                    # Full detail comes straight from the layer's SoA arrays;
+                    # no geometry traversal is needed.
+                    path = _build_painter_path(layer.coords, layer.indices)
+                else:
+                    # One device pixel spans about 1/scale scene units; use
+                    # the bucket's finest pixel size so detail never visibly
+                    # degrades.
+                    tolerance = 2.0 ** (-level - 1)
+                    keep = layer.lengths >= tolerance
+                    geometries = shapely.simplify(layer.geometries[keep], tolerance)
+                    coords, indices = _extract_display_coords(geometries)
+                    path = _build_painter_path(coords, indices)
+                layer.lod_paths[level] = path
+            layer.items[0].setPath(path)
+            layer.lod_level = level
 
     # ------------------------------------------------------------------
     # Overlay configuration API
     # ------------------------------------------------------------------
     def set_scale_bar_visible(self, visible: bool) -> None:
         self._show_scale_bar = visible
-        self.viewport().update()
+        self.viewport().update(self._scale_bar_rect())
 
     def scale_bar_visible(self) -> bool:
         return self._show_scale_bar
 
     def set_scale_bar_parameters(self, length: float, units: str) -> None:
+        dirty = self._scale_bar_rect()
         if length > 0:
             self._scale_bar_length = length
         self._scale_bar_units = units or self._scale_bar_units
-        self.viewport().update()
+        self._scale_bar_picture_key = None
+        self.viewport().update(dirty.united(self._scale_bar_rect()))
+
+    def _scale_bar_rect(self) -> QRect:
+        """Viewport rect covered by the scale bar, its ticks and its label.
+
+        Used as the damage rect for overlay toggles so the whole network does
+        not repaint when only the corner widget changes.
+        """
+
+        view_rect = self.viewport().rect()
+        margin = 40
+        scale = self._pixels_per_scene_unit
+        bar_pixels = self._scale_bar_length * scale
+        if bar_pixels > view_rect.width() * 0.5:
+            bar_pixels = view_rect.width() * 0.5
+        metrics = self._font_metrics
+        # Measure the exact string _paint_scale_bar draws: it labels the bar
+        # in scene units, which exceed bar_pixels when zoomed out.
+        actual_units = bar_pixels / scale if scale else self._scale_bar_length
+        text = f"{actual_units:.2f} {self._scale_bar_units}"
+        width = max(bar_pixels, metrics.horizontalAdvance(text)) + 8
+        height = metrics.height() + 8 + 10
+        return QRect(
+            margin - 2,
+            int(view_rect.height() - margin - height),
+            int(width) + 4,
+            int(height) + 10,
+        )
 
     def scale_bar_parameters(self) -> Tuple[float, str]:
         return self._scale_bar_length, self._scale_bar_units
@@ -539,12 +768,6 @@ class NetworkCanvas(QGraphicsView):
             event.ignore()
             return
         factor = self._zoom_step if delta > 0 else 1.0 / self._zoom_step
-        current_scale = self.transform().m11()
-        new_scale = current_scale * factor
-        min_scale, max_scale = self._zoom_limits
-        if new_scale < min_scale or new_scale > max_scale:
-            event.accept()
-            return
         self._apply_zoom(factor)
         event.accept()
 
@@ -584,7 +807,13 @@ class NetworkCanvas(QGraphicsView):
     def drawForeground(self, painter: QPainter, rect: QRectF) -> None:  # type: ignore[override]
         super().drawForeground(painter, rect)
         if self._show_grid and self._grid_spacing > 0:
-            self._draw_grid_scene(painter, rect)
+            # The exposed rect can span the whole scene (e.g. after a full
+            # update); clamp it to the viewport so grid generation stays
+            # proportional to what is actually on screen.
+            visible = self.mapToScene(self.viewport().rect()).boundingRect()
+            clipped = rect.intersected(visible)
+            if not clipped.isEmpty():
+                self._draw_grid_scene(painter, clipped)
         if self._show_scale_bar and self._scale_bar_length > 0:
             self._draw_scale_bar_view(painter)
 
@@ -592,6 +821,9 @@ class NetworkCanvas(QGraphicsView):
         spacing = self._grid_spacing
         if spacing <= 0:
             return
+        spacing = _effective_grid_spacing(spacing, self._pixels_per_scene_unit)
+        if spacing is None:
+            return
         painter.save()
         painter.setPen(self._grid_pen)
         left = min(rect.left(), rect.right())
@@ -603,51 +835,57 @@ class NetworkCanvas(QGraphicsView):
             painter.restore()
             return
 
-        start_x = spacing * int(left // spacing)
-        if start_x > left:
-            start_x -= spacing
-        x = start_x
-        count = 0
-        while x <= right and count < 2000:
-            painter.drawLine(x, bottom, x, top)
-            x += spacing
-            count += 1
-
-        start_y = spacing * int(bottom // spacing)
-        if start_y > bottom:
-            start_y -= spacing
-        y = start_y
-        count = 0
-        while y <= top and count < 2000:
-            painter.drawLine(left, y, right, y)
-            y += spacing
-            count += 1
+        xs = _grid_positions(left, right, spacing)
+        ys = _grid_positions(bottom, top, spacing)
+        lines = [QLineF(x, bottom, x, top) for x in xs.tolist()]
+        lines += [QLineF(left, y, right, y) for y in ys.tolist()]
+        if lines:
+            painter.drawLines(lines)
         painter.restore()
 
     def _draw_scale_bar_view(self, painter: QPainter) -> None:
-        scale = abs(self.transform().m11())
+        scale = self._pixels_per_scene_unit
         if scale <= 0:
             return
+        view_rect = self.viewport().rect()
+        # The bar only changes with zoom, viewport size or its parameters;
+        # between those events replay a recorded QPicture instead of
+        # re-issuing the draw calls every frame.
+        key = (
+            round(scale, 6),
+            view_rect.width(),
+            view_rect.height(),
+            self._scale_bar_length,
+            self._scale_bar_units,
+        )
+        if self._scale_bar_picture is None or key != self._scale_bar_picture_key:
+            picture = QPicture()
+            recorder = QPainter(picture)
+            self._paint_scale_bar(recorder, scale, view_rect)
+            recorder.end()
+            self._scale_bar_picture = picture
+            self._scale_bar_picture_key = key
+
+        painter.save()
+        painter.resetTransform()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPicture(0, 0, self._scale_bar_picture)
+        painter.restore()
+
+    def _paint_scale_bar(self, painter: QPainter, scale: float, view_rect: QRect) -> None:
         margin = 40
         bar_pixels = self._scale_bar_length * scale
-        view_rect = self.viewport().rect()
         if bar_pixels > view_rect.width() * 0.5:
             bar_pixels = view_rect.width() * 0.5
         actual_units = bar_pixels / scale if scale else self._scale_bar_length
 
-        painter.save()
-        painter.resetTransform()
-        painter.setRenderHint(QPainter.Antialiasing, True)
         y = view_rect.height() - margin
         x_start = margin
         x_end = x_start + bar_pixels
         painter.setPen(self._scale_pen)
-        painter.drawLine(int(x_start), int(y), int(x_end), int(y))
-        painter.drawLine(int(x_start), int(y - 5), int(x_start), int(y + 5))
-        painter.drawLine(int(x_end), int(y - 5), int(x_end), int(y + 5))
+        painter.drawPolyline(_scale_bar_polyline(x_start, x_end, y))
         text = f"{actual_units:.2f} {self._scale_bar_units}"
         painter.setFont(self._font)
         painter.drawText(int(x_start), int(y - 8), text)
-        painter.restore()
 
 __all__ = ["NetworkCanvas", "CanvasLayer"]
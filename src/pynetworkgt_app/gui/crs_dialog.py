@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 try:  # pragma: no cover - import guard for PySide6
@@ -19,6 +20,10 @@ except ImportError as exc:  # pragma: no cover
     raise RuntimeError("PySide6 is required to use the GUI components") from exc
 
 
+#: Optional "EPSG:" prefix followed by the bare code, ignoring edge whitespace.
+_EPSG_RE = re.compile(r"^\s*(?:EPSG:\s*)?(\d+)\s*$", re.IGNORECASE)
+
+
 class CrsAssignmentDialog(QDialog):
     """Collect a CRS definition (EPSG code) from the user."""
 
@@ -72,18 +77,8 @@ class CrsAssignmentDialog(QDialog):
 
     @staticmethod
     def _normalise_epsg(text: str) -> str:
-        value = text.strip()
-        if not value:
-            return ""
-        upper = value.upper()
-        if upper.startswith("EPSG:"):
-            suffix = upper.split("EPSG:", 1)[1]
-        else:
-            suffix = upper
-        suffix = suffix.strip()
-        if not suffix.isdigit():
-            return ""
-        return f"EPSG:{suffix}"
+        match = _EPSG_RE.match(text)
+        return f"EPSG:{match.group(1)}" if match else ""
 
 
 __all__ = ["CrsAssignmentDialog"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -29,24 +29,63 @@ except ImportError as exc:  # pragma: no cover
     raise RuntimeError("PySide6 is required to use the GUI components") from exc
 
 
-@dataclass
 class ExportSettings:
-    path: Path
-    format: str
-    width: int
-    height: int
-    dpi: int
-    background: QColor
-    title: str
-    include_legend: bool
-    include_scale_bar: bool
-    include_grid: bool
+    """Value object bundling the options collected by :class:`ExportDialog`.
+
+    ``path`` is kept as a plain string; callers that need ``Path`` semantics
+    wrap it once at their boundary.
+    """
+
+    __slots__ = (
+        "path",
+        "format",
+        "width",
+        "height",
+        "dpi",
+        "background",
+        "title",
+        "include_legend",
+        "include_scale_bar",
+        "include_grid",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        format: str,
+        width: int,
+        height: int,
+        dpi: int,
+        background: QColor,
+        title: str,
+        include_legend: bool,
+        include_scale_bar: bool,
+        include_grid: bool,
+    ) -> None:
+        self.path = path
+        self.format = format
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.background = background
+        self.title = title
+        self.include_legend = include_legend
+        self.include_scale_bar = include_scale_bar
+        self.include_grid = include_grid
 
 
 class ExportDialog(QDialog):
     """Collect export configuration from the user."""
 
-    FORMATS = ["PNG", "JPEG", "SVG"]
+    FORMATS = ("PNG", "JPEG", "SVG")
+    _FILTERS = ";;".join(f"{fmt} (*.{fmt.lower()})" for fmt in FORMATS)
+    _SUFFIX_BY_FMT = {fmt: fmt.lower() for fmt in FORMATS}
+    _FMT_INDEX = {fmt.lower(): index for index, fmt in enumerate(FORMATS)}
+    # Only two text colours are ever used, so keep one template per case and
+    # substitute just the background; identical stylesheet strings also let
+    # Qt's style cache hit.
+    _STYLE_DARK_TEXT = "background-color: %s; color: #000000;"
+    _STYLE_LIGHT_TEXT = "background-color: %s; color: #ffffff;"
 
     def __init__(
         self,
@@ -63,8 +102,63 @@ class ExportDialog(QDialog):
         self.setWindowTitle("Export Canvas")
         self._path = default_path
         self._background = QColor("#ffffff")
+        self._default_width = default_width
+        self._default_height = default_height
+        self._show_scale_bar = show_scale_bar
+        self._show_grid = show_grid
+        self._include_legend = include_legend
+        self._ui_built = False
+
+    def reset(
+        self,
+        *,
+        default_path: Path,
+        default_width: int,
+        default_height: int,
+        show_scale_bar: bool,
+        show_grid: bool,
+        include_legend: bool,
+    ) -> None:
+        """Re-arm a recycled dialog with fresh defaults.
+
+        Callers keep one dialog instance alive and call this per export
+        instead of rebuilding the widget tree and signal wiring each time.
+        """
+
+        self._path = default_path
+        self._default_width = default_width
+        self._default_height = default_height
+        self._show_scale_bar = show_scale_bar
+        self._show_grid = show_grid
+        self._include_legend = include_legend
+        if not self._ui_built:
+            return
+        self._path_edit.setText(str(default_path))
+        self._set_format_from_path(default_path)
+        self._width_spin.setValue(default_width)
+        self._height_spin.setValue(default_height)
+        self._legend_check.setChecked(include_legend)
+        self._scale_bar_check.setChecked(show_scale_bar)
+        self._grid_check.setChecked(show_grid)
+
+    def showEvent(self, event):  # type: ignore[override]
+        # Widgets, layouts and signal wiring are only paid for when the
+        # dialog is actually shown, not when it is constructed speculatively.
+        if not self._ui_built:
+            self._build_ui()
+            self._ui_built = True
+        super().showEvent(event)
+
+    def _build_ui(self) -> None:
+        default_path = self._path
+        default_width = self._default_width
+        default_height = self._default_height
+        show_scale_bar = self._show_scale_bar
+        show_grid = self._show_grid
+        include_legend = self._include_legend
 
         self._path_edit = QLineEdit(str(default_path))
+        self._path_edit.editingFinished.connect(self._on_path_edited)
         browse_button = QPushButton("Browse…")
         browse_button.clicked.connect(self._select_path)
 
@@ -73,17 +167,19 @@ class ExportDialog(QDialog):
         path_row.addWidget(browse_button)
 
         self._format_combo = QComboBox()
-        self._format_combo.addItems(self.FORMATS)
-        self._format_combo.currentTextChanged.connect(self._on_format_changed)
+        self._format_combo.addItems(list(self.FORMATS))
+        # Wire the handler only after the initial selection so construction
+        # does not dispatch a spurious format change that rewrites the path.
         self._set_format_from_path(default_path)
+        self._format_combo.currentTextChanged.connect(self._on_format_changed)
 
         self._width_spin = QSpinBox()
         self._width_spin.setRange(1, 100_000)
-        self._width_spin.setValue(max(default_width, 1))
+        self._width_spin.setValue(default_width)
 
         self._height_spin = QSpinBox()
         self._height_spin.setRange(1, 100_000)
-        self._height_spin.setValue(max(default_height, 1))
+        self._height_spin.setValue(default_height)
 
         self._dpi_spin = QSpinBox()
         self._dpi_spin.setRange(30, 1200)
@@ -126,6 +222,8 @@ class ExportDialog(QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+        # Running inside the first showEvent means this size-hint pass happens
+        # once, against a fully resolved layout, never at construction time.
         self.resize(420, self.sizeHint().height())
 
     # ------------------------------------------------------------------
@@ -133,12 +231,11 @@ class ExportDialog(QDialog):
     # ------------------------------------------------------------------
     def _select_path(self) -> None:
         current_dir = self._path.parent if self._path else Path.home()
-        filters = ";;".join(f"{fmt} (*.{fmt.lower()})" for fmt in self.FORMATS)
         selected, _ = QFileDialog.getSaveFileName(
             self,
             "Select export file",
             str(current_dir),
-            filters,
+            self._FILTERS,
         )
         if not selected:
             return
@@ -146,40 +243,59 @@ class ExportDialog(QDialog):
         self._path_edit.setText(str(self._path))
         self._set_format_from_path(self._path)
 
+    def _on_path_edited(self) -> None:
+        # Re-parse the edit text only when the user actually changed it, so
+        # settings() can rely on self._path instead of rebuilding a Path per
+        # call.
+        text = self._path_edit.text()
+        if text and text != str(self._path):
+            self._path = Path(text)
+
     def _on_format_changed(self, fmt: str) -> None:
-        suffix = fmt.lower()
-        if self._path.suffix.lower() != f".{suffix}":
-            self._path = self._path.with_suffix(f".{suffix}")
-            self._path_edit.setText(str(self._path))
+        suffix = self._SUFFIX_BY_FMT[fmt]
+        # splitext plus concatenation beats Path.with_suffix's full
+        # parse/rebuild for a callback fired on every combo change.
+        root, ext = os.path.splitext(str(self._path))
+        if ext.lower() != f".{suffix}":
+            text = f"{root}.{suffix}"
+            self._path = Path(text)
+            self._path_edit.setText(text)
 
     def _choose_background(self) -> None:
         color = QColorDialog.getColor(self._background, self, "Background colour")
         if not color.isValid():
             return
+        if color.rgba() == self._background.rgba():
+            # Re-picking the same colour would only trigger a stylesheet
+            # reparse and repaint for nothing.
+            return
         self._background = color
         self._update_background_button()
 
     def _update_background_button(self) -> None:
         text = self._background.name()
         self._background_button.setText(text)
-        luminance = self._background.lightness()
-        text_color = "#000000" if luminance > 128 else "#ffffff"
-        self._background_button.setStyleSheet(
-            f"background-color: {text}; color: {text_color};"
+        template = (
+            self._STYLE_DARK_TEXT
+            if self._background.lightness() > 128
+            else self._STYLE_LIGHT_TEXT
         )
+        self._background_button.setStyleSheet(template % text)
 
     def _set_format_from_path(self, path: Path) -> None:
         suffix = path.suffix.lower().lstrip('.')
-        if suffix.upper() in self.FORMATS:
-            idx = self.FORMATS.index(suffix.upper())
-            self._format_combo.setCurrentIndex(idx)
+        index = self._FMT_INDEX.get(suffix)
+        if index is not None:
+            self._format_combo.setCurrentIndex(index)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def settings(self) -> ExportSettings:
         fmt = self._format_combo.currentText()
-        path = Path(self._path_edit.text()).with_suffix(f".{fmt.lower()}")
+        self._on_path_edited()
+        root, _ = os.path.splitext(str(self._path))
+        path = f"{root}.{self._SUFFIX_BY_FMT[fmt]}"
         return ExportSettings(
             path=path,
             format=fmt,
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable, List, Optional, Union
 
+import numpy as np
+import shapely
 from shapely.geometry.base import BaseGeometry
 
 from ..core.fracture import FractureLine, FractureNetwork
@@ -17,6 +19,16 @@ except ImportError as exc:  # pragma: no cover - runtime dependency
 else:
     _IMPORT_ERROR = None
 
+try:  # pragma: no cover - optional fast path
+    import fiona
+except ImportError:  # pragma: no cover
+    fiona = None
+
+try:  # pragma: no cover - optional fast path
+    import pyogrio
+except ImportError:  # pragma: no cover
+    pyogrio = None
+
 
 class FractureGpkgError(RuntimeError):
     """Raised when a GeoPackage fracture layer cannot be parsed."""
@@ -47,15 +59,35 @@ def read_fracture_gpkg(
         ``FractureLine`` records. Otherwise keep them as a single entry.
     """
 
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FractureGpkgError(f"GeoPackage file not found: {file_path}")
+
+    if pyogrio is not None:
+        # Vectorised path: the whole layer arrives as Arrow arrays and the
+        # geometries are decoded by Shapely in a handful of C calls.
+        return _read_arrow(
+            file_path,
+            layer,
+            include_attributes=include_attributes,
+            explode_multilines=explode_multilines,
+        )
+
+    if fiona is not None:
+        # Streaming path: one feature in memory at a time instead of the
+        # whole layer materialised as a DataFrame first.
+        return _read_streaming(
+            file_path,
+            layer,
+            include_attributes=include_attributes,
+            explode_multilines=explode_multilines,
+        )
+
     if gpd is None:  # pragma: no cover - executed when geopandas missing
         raise FractureGpkgError(
             "geopandas is required to read GeoPackage files"
         ) from _IMPORT_ERROR
 
-    file_path = Path(path)
-    if not file_path.exists():
-        raise FractureGpkgError(f"GeoPackage file not found: {file_path}")
-
     try:
         gdf = gpd.read_file(file_path, layer=layer)
     except Exception as exc:  # pragma: no cover - geopandas handles errors
@@ -64,24 +96,50 @@ def read_fracture_gpkg(
     if gdf.empty:
         raise FractureGpkgError("Layer contains no features")
 
+    # iterrows boxes every row into a Series just so we can read two fields
+    # back out; iterating the geometry column and a records dump directly
+    # avoids the per-row allocations.
+    geometries = gdf.geometry.values
+    # Validate every geometry type in one vectorised pass; the per-row
+    # geom_type attribute goes through GEOS for each feature. Missing
+    # geometries report type id -1 and are skipped in the loop below.
+    type_ids = shapely.get_type_id(geometries)
+    invalid = ~np.isin(type_ids, (_LINESTRING_ID, _MULTILINESTRING_ID, -1))
+    if invalid.any():
+        geom_type = geometries[invalid][0].geom_type
+        raise FractureGpkgError(
+            f"Unsupported geometry type '{geom_type}'. Only lines are allowed."
+        )
+
+    if include_attributes:
+        attrs_iter: Iterable[dict] = gdf.drop(columns=gdf.geometry.name).to_dict("records")
+    else:
+        attrs_iter = ({} for _ in range(len(gdf)))
+
     lines: List[FractureLine] = []
-    for _, row in gdf.iterrows():
-        geometry: BaseGeometry = row.geometry
+    multi_geoms: List[BaseGeometry] = []
+    multi_attrs: List[dict] = []
+    for geometry, attrs, type_id in zip(geometries, attrs_iter, type_ids):
         if geometry is None or geometry.is_empty:
             continue
-        geom_type = geometry.geom_type
-        if geom_type not in SUPPORTED_GEOMETRIES:
-            raise FractureGpkgError(
-                f"Unsupported geometry type '{geom_type}'. Only lines are allowed."
-            )
 
-        attrs = _extract_attributes(row, include_attributes)
-
-        if geom_type == "LineString" or not explode_multilines:
+        if type_id == _LINESTRING_ID or not explode_multilines:
             lines.append(FractureLine(geometry=geometry, properties=attrs))
         else:
-            for part in geometry.geoms:  # type: ignore[attr-defined]
-                lines.append(FractureLine(geometry=part, properties=attrs.copy()))
+            multi_geoms.append(geometry)
+            multi_attrs.append(attrs)
+
+    if multi_geoms:
+        # One get_parts call explodes every MultiLineString; the parent-index
+        # array aligns each part with its source feature's attributes.
+        parts, parent_index = shapely.get_parts(
+            np.asarray(multi_geoms, dtype=object), return_index=True
+        )
+        lines.extend(
+            # Parts share the parent feature's dict; see _read_arrow.
+            FractureLine(geometry=part, properties=multi_attrs[parent])
+            for part, parent in zip(parts, parent_index)
+        )
 
     if not lines:
         raise FractureGpkgError("No valid line geometries were found in the layer")
@@ -90,6 +148,158 @@ def read_fracture_gpkg(
     return FractureNetwork(lines=lines, crs=crs, source=file_path)
 
 
+#: Shapely integer type ids for the geometries a fracture layer may contain.
+_LINESTRING_ID = 1
+_MULTILINESTRING_ID = 5
+
+#: Networks above this many lines are written in appended slices.
+_WRITE_CHUNK_SIZE = 100_000
+
+
+def _write_chunked(
+    network: FractureNetwork,
+    file_path: Path,
+    *,
+    layer: str,
+    driver: str,
+) -> None:
+    """Append chunk-sized GeoDataFrames to the layer one at a time.
+
+    Each slice is converted, written and released before the next one is
+    built, so peak memory stays at chunk size regardless of network size.
+    """
+
+    geometries = network.geometries
+    properties = network.properties
+    total = len(geometries)
+    for start in range(0, total, _WRITE_CHUNK_SIZE):
+        stop = min(start + _WRITE_CHUNK_SIZE, total)
+        chunk = gpd.GeoDataFrame(
+            properties[start:stop] if properties is not None else None,
+            geometry=geometries[start:stop],
+            crs=network.crs,
+        )
+        try:
+            pyogrio.write_dataframe(
+                chunk, file_path, layer=layer, driver=driver, append=start > 0
+            )
+        except Exception as exc:
+            raise FractureGpkgError(f"Failed to write GeoPackage: {exc}") from exc
+
+
+def _read_arrow(
+    file_path: Path,
+    layer: Optional[str],
+    *,
+    include_attributes: bool,
+    explode_multilines: bool,
+) -> FractureNetwork:
+    """Read the layer through pyogrio's Arrow interface, fully vectorised.
+
+    The WKB column is decoded with :func:`shapely.from_wkb` in one C call,
+    type checks run as a NumPy mask over the whole array, and multilines are
+    exploded with :func:`shapely.get_parts` instead of a per-feature Python
+    loop.
+    """
+
+    try:
+        meta, table = pyogrio.read_arrow(file_path, layer=layer)
+    except Exception as exc:  # pragma: no cover - pyogrio handles errors
+        raise FractureGpkgError(f"Failed to read GeoPackage: {exc}") from exc
+
+    if table.num_rows == 0:
+        raise FractureGpkgError("Layer contains no features")
+
+    geometry_name = meta.get("geometry_name") or "wkb_geometry"
+    wkb = table.column(geometry_name).to_numpy(zero_copy_only=False)
+    geometries = shapely.from_wkb(wkb)
+
+    if include_attributes:
+        attributes = table.drop_columns([geometry_name]).to_pylist()
+    else:
+        attributes = [{} for _ in range(len(geometries))]
+
+    keep = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    geometries = geometries[keep]
+    attributes = [attrs for attrs, flag in zip(attributes, keep) if flag]
+
+    type_ids = shapely.get_type_id(geometries)
+    invalid = ~np.isin(type_ids, (_LINESTRING_ID, _MULTILINESTRING_ID))
+    if invalid.any():
+        geom_type = geometries[invalid][0].geom_type
+        raise FractureGpkgError(
+            f"Unsupported geometry type '{geom_type}'. Only lines are allowed."
+        )
+
+    if explode_multilines:
+        parts, parent_index = shapely.get_parts(geometries, return_index=True)
+        geometries = parts
+        # Parts share the parent feature's dict: properties are read-only
+        # downstream, so per-part copies would only multiply allocations.
+        attributes = [attributes[parent] for parent in parent_index]
+
+    if len(geometries) == 0:
+        raise FractureGpkgError("No valid line geometries were found in the layer")
+
+    crs = meta.get("crs") or None
+    return FractureNetwork.from_geometries(
+        geometries, attributes, crs=crs, source=file_path
+    )
+
+
+def _read_streaming(
+    file_path: Path,
+    layer: Optional[str],
+    *,
+    include_attributes: bool,
+    explode_multilines: bool,
+) -> FractureNetwork:
+    """Read the layer feature by feature through fiona.
+
+    Peak memory stays at one feature plus our own line list, instead of the
+    full layer as a DataFrame followed by a row-by-row rebuild.
+    """
+
+    from shapely.geometry import shape
+
+    lines: List[FractureLine] = []
+    feature_count = 0
+    try:
+        with fiona.open(file_path, layer=layer) as src:
+            crs = src.crs_wkt or None
+            for feature in src:
+                feature_count += 1
+                raw_geometry = feature.get("geometry")
+                if raw_geometry is None:
+                    continue
+                geometry = shape(raw_geometry)
+                if geometry.is_empty:
+                    continue
+                geom_type = geometry.geom_type
+                if geom_type not in SUPPORTED_GEOMETRIES:
+                    raise FractureGpkgError(
+                        f"Unsupported geometry type '{geom_type}'. Only lines are allowed."
+                    )
+                attrs = dict(feature["properties"]) if include_attributes else {}
+                if geom_type == "LineString" or not explode_multilines:
+                    lines.append(FractureLine(geometry=geometry, properties=attrs))
+                else:
+                    for part in geometry.geoms:
+                        # Parts share the feature's dict; see _read_arrow.
+                        lines.append(FractureLine(geometry=part, properties=attrs))
+    except FractureGpkgError:
+        raise
+    except Exception as exc:  # pragma: no cover - fiona handles errors
+        raise FractureGpkgError(f"Failed to read GeoPackage: {exc}") from exc
+
+    if not feature_count:
+        raise FractureGpkgError("Layer contains no features")
+    if not lines:
+        raise FractureGpkgError("No valid line geometries were found in the layer")
+
+    return FractureNetwork(lines=lines, crs=crs, source=file_path)
+
+
 def write_fracture_gpkg(
     network: FractureNetwork,
     path: Union[str, Path],
@@ -109,28 +319,47 @@ def write_fracture_gpkg(
     if file_path.parent and not file_path.parent.exists():
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    gdf = network.to_geodataframe()
+    if pyogrio is not None and len(network) > _WRITE_CHUNK_SIZE:
+        # Building the full GeoDataFrame first would peak at dataset size;
+        # appending chunk-sized frames caps memory at one chunk.
+        if overwrite and file_path.exists():
+            file_path.unlink()
+        _write_chunked(network, file_path, layer=layer, driver=driver)
+        return file_path
+
+    # Writing the same network to several files or layers should not rebuild
+    # the GeoDataFrame each time; the key tracks the identity of the backing
+    # arrays plus the CRS, so replacing either invalidates the cache.
+    cache_key = (
+        id(network.geometries),
+        len(network.geometries),
+        id(network.properties),
+        network.crs,
+    )
+    cached = getattr(network, "_gdf_cache", None)
+    if cached is not None and cached[0] == cache_key:
+        gdf = cached[1]
+    else:
+        gdf = network.to_geodataframe()
+        network._gdf_cache = (cache_key, gdf)
 
     if overwrite and file_path.exists():
         file_path.unlink()
 
     try:
-        gdf.to_file(file_path, layer=layer, driver=driver)
+        if pyogrio is not None:
+            # Direct GDAL bindings write the whole frame without Python-level
+            # per-feature iteration; substantially faster than the fiona
+            # backend older geopandas defaults to.
+            pyogrio.write_dataframe(gdf, file_path, layer=layer, driver=driver)
+        else:
+            gdf.to_file(file_path, layer=layer, driver=driver)
     except Exception as exc:
         raise FractureGpkgError(f"Failed to write GeoPackage: {exc}") from exc
 
     return file_path
 
 
-def _extract_attributes(row, include: bool) -> dict:
-    if not include:
-        return {}
-
-    attrs = row.to_dict()
-    attrs.pop("geometry", None)
-    return attrs
-
-
 __all__ = [
     "read_fracture_gpkg",
     "write_fracture_gpkg",
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import warnings
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Union
 
+import numpy as np
+import shapely
 from shapely.geometry import LineString
 
 from ..core.fracture import FractureLine, FractureNetwork
@@ -46,32 +49,43 @@ def read_fracture_txt(
     if not file_path.exists():
         raise FractureTxtError(f"Fracture file not found: {file_path}")
 
-    lines: List[FractureLine] = []
-    raw_lines = file_path.read_text(encoding="utf-8").splitlines()
+    if skip_empty:
+        network = _read_txt_batched(file_path, delimiter, comment_prefix)
+        if network is not None:
+            return network
 
-    for index, raw_line in enumerate(raw_lines, start=1):
-        entry = raw_line.strip()
-        if not entry:
-            if skip_empty:
+    lines: List[FractureLine] = []
+    # Iterate the handle directly: reading the whole file via read_text plus
+    # splitlines holds roughly three copies of the data at peak, while the
+    # streaming loop keeps one buffered line at a time and can bail out
+    # early on malformed input.
+    with file_path.open("r", encoding="utf-8", buffering=1 << 20) as handle:
+        for index, raw_line in enumerate(handle, start=1):
+            entry = raw_line.strip()
+            if not entry:
+                if skip_empty:
+                    continue
+                raise FractureTxtError(f"Blank line at {index} in {file_path}")
+            if entry.startswith(comment_prefix):
                 continue
-            raise FractureTxtError(f"Blank line at {index} in {file_path}")
-        if entry.startswith(comment_prefix):
-            continue
 
-        try:
-            coordinates = _parse_coordinate_sequence(entry, delimiter)
-        except ValueError as exc:
-            raise FractureTxtError(
-                f"Invalid numeric values on line {index}: {exc}" 
-            ) from exc
-        except FractureTxtError as exc:
-            raise FractureTxtError(f"Line {index}: {exc}") from exc
+            # Tokenise once; the count checks in the parser reject malformed
+            # lines before any float conversion is paid for.
+            tokens = entry.split(delimiter) if delimiter is not None else entry.split()
+            try:
+                coordinates = _parse_coordinate_tokens(tokens)
+            except ValueError as exc:
+                raise FractureTxtError(
+                    f"Invalid numeric values on line {index}: {exc}"
+                ) from exc
+            except FractureTxtError as exc:
+                raise FractureTxtError(f"Line {index}: {exc}") from exc
 
-        line_geometry = LineString(coordinates)
-        if line_geometry.is_empty:
-            raise FractureTxtError(f"Line {index} resulted in an empty geometry")
+            line_geometry = LineString(coordinates)
+            if line_geometry.is_empty:
+                raise FractureTxtError(f"Line {index} resulted in an empty geometry")
 
-        lines.append(FractureLine(geometry=line_geometry))
+            lines.append(FractureLine(geometry=line_geometry))
 
     if not lines:
         raise FractureTxtError(f"No fracture geometries found in {file_path}")
@@ -79,6 +93,39 @@ def read_fracture_txt(
     return FractureNetwork(lines=lines, source=file_path)
 
 
+def _read_txt_batched(
+    file_path: Path, delimiter: Optional[str], comment_prefix: str
+) -> Optional[FractureNetwork]:
+    """Parse a homogeneous TXT file in a single ``np.loadtxt`` pass.
+
+    Files whose data lines all carry the same coordinate count — the common
+    case for exported fracture networks — parse entirely in C and the
+    geometries come back from one vectorised ``shapely.linestrings`` call.
+    Returns ``None`` for ragged or otherwise non-uniform input so the caller
+    can fall through to the per-line path and its precise error reporting.
+    """
+
+    try:
+        with warnings.catch_warnings():
+            # Empty input is reported as a UserWarning; the fallback path
+            # produces the proper FractureTxtError for that case.
+            warnings.simplefilter("ignore", UserWarning)
+            raw = np.loadtxt(
+                file_path,
+                comments=comment_prefix,
+                delimiter=delimiter,
+                dtype=np.float64,
+                ndmin=2,
+            )
+    except ValueError:
+        return None
+    if raw.size == 0 or raw.shape[1] % 2 != 0 or raw.shape[1] < 4:
+        return None
+
+    geometries = shapely.linestrings(raw.reshape(raw.shape[0], -1, 2))
+    return FractureNetwork.from_geometries(geometries, None, source=file_path)
+
+
 def write_fracture_txt(
     network: FractureNetwork,
     path: Union[str, Path],
@@ -104,42 +151,39 @@ def write_fracture_txt(
     if file_path.parent and not file_path.parent.exists():
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: List[str] = []
-    if include_comments:
-        if network.crs:
-            lines.append(f"# CRS: {network.crs}")
-        if network.source:
-            lines.append(f"# Source: {network.source}")
-
-    for fracture in network.lines:
-        coords = [f"{coord:.12g}" for point in fracture.geometry.coords for coord in point]
-        lines.append(delimiter.join(coords))
-
-    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Stream each row straight into a large-buffered handle; building the
+    # full list of formatted lines first doubled peak memory on big networks.
+    with file_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        if include_comments:
+            if network.crs:
+                handle.write(f"# CRS: {network.crs}\n")
+            if network.source:
+                handle.write(f"# Source: {network.source}\n")
+
+        # savetxt formats each field with a C snprintf, replacing two Python
+        # format calls per coordinate; iterating the geometry array skips the
+        # per-fracture view objects as well.
+        for geometry in network.geometries:
+            row = np.asarray(geometry.coords, dtype=np.float64).reshape(1, -1)
+            np.savetxt(handle, row, fmt="%.12g", delimiter=delimiter)
     return file_path
 
 
-def _parse_coordinate_sequence(
-    text: str, delimiter: Optional[str]
-) -> List[Tuple[float, float]]:
-    """Convert a whitespace or delimiter separated string into coordinates."""
-
-    raw_values = text.split(delimiter) if delimiter is not None else text.split()
-    if len(raw_values) % 2 != 0:
-        raise FractureTxtError("Coordinate list must contain an even number of values")
+def _parse_coordinate_tokens(tokens: List[str]) -> np.ndarray:
+    """Convert pre-split coordinate tokens into an ``(n, 2)`` array.
 
-    values: List[float] = [float(value) for value in raw_values]
-    coordinates: List[Tuple[float, float]] = []
-
-    for index in range(0, len(values), 2):
-        x = values[index]
-        y = values[index + 1]
-        coordinates.append((x, y))
+    The cheap count checks run first so a malformed line fails before the
+    float parse; conversion itself happens inside NumPy's C parser in one
+    pass, and a malformed token surfaces as :class:`ValueError` for the
+    caller to wrap.
+    """
 
-    if len(coordinates) < 2:
+    if len(tokens) % 2 != 0:
+        raise FractureTxtError("Coordinate list must contain an even number of values")
+    if len(tokens) < 4:
         raise FractureTxtError("Each fracture line must contain at least two points")
 
-    return coordinates
+    return np.asarray(tokens, dtype=np.float64).reshape(-1, 2)
 
 
 __all__ = ["read_fracture_txt", "write_fracture_txt", "FractureTxtError"]
@@ -34,6 +34,19 @@ def test_threshold_percentile_blur():
     assert binary.shape == image.shape
 
 
+def test_threshold_float_rgb_outside_unit_range():
+    rgb = np.zeros((16, 16, 3), dtype=np.float64)
+    rgb[:, :] = [255.0, 0.0, 0.0]
+    rgb[4:12, 4:12] = [0.0, 0.0, 0.0]
+
+    for opts in (
+        ThresholdOptions(method="otsu"),
+        ThresholdOptions(method="adaptive", block_size=0),
+    ):
+        binary = threshold_array(rgb, options=opts)
+        assert binary.shape == rgb.shape[:2]
+
+
 def test_threshold_inversion_and_rgb():
     rgb = np.zeros((16, 16, 3), dtype=np.uint8)
     rgb[:, :] = [255, 0, 0]